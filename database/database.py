@@ -1,5 +1,8 @@
+import logging
+import os
+
 import aiomysql
-from pymysql.err import ProgrammingError, DataError
+from pymysql.err import DataError, MySQLError
 from typing import Optional
 from database.config import load_config
 
@@ -7,6 +10,16 @@ from database.config import load_config
 # Загрузка конфигурации для подключения к базе данных
 config = load_config()
 
+# Текст запроса вставки комментария, одинаковый для всех вызовов
+SQL_INSERT_COMMENT = "INSERT INTO comments (text_comment) VALUES (%s)"
+# Максимальное количество строк в одном INSERT при пакетной загрузке комментариев
+COMMENTS_CHUNK_SIZE = 500
+
+# Границы пула соединений: верхняя граница зависит от количества ядер
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = (os.cpu_count() or 1) * 2 + 1
+POOL_RECYCLE = 1800  # Время жизни соединения в пуле (в секундах).
+
 
 class SqlTable:
     """
@@ -44,7 +57,10 @@ class SqlTable:
             host=self.host,
             password=self.password,
             db=self.db_name,
-            autocommit=True
+            autocommit=True,
+            minsize=POOL_MIN_SIZE,
+            maxsize=POOL_MAX_SIZE,
+            pool_recycle=POOL_RECYCLE
         )
 
     async def close_connect(self) -> None:
@@ -55,21 +71,46 @@ class SqlTable:
             self.connection_pool.close()
             await self.connection_pool.wait_closed()
 
-    async def _input_cmd(self, cmd: str) -> Optional[aiomysql.Cursor]:
+    async def _input_cmd(self, cmd: str, params: tuple | None = None) -> Optional[aiomysql.Cursor]:
         """
         Выполняет SQL-запрос в базе данных.
 
-        :param cmd: SQL-запрос для выполнения.
+        Значения передаются отдельно от текста запроса и экранируются драйвером.
+        Для пакетной вставки используется _input_batch.
+
+        :param cmd: SQL-запрос для выполнения с плейсхолдерами %s.
+        :param params: Кортеж параметров запроса или None.
         :return: Курсор базы данных, если запрос выполнен успешно, иначе None.
         """
         try:
             async with self.connection_pool.acquire() as connection:
                 async with connection.cursor() as cursor:
-                    await cursor.execute(cmd)
+                    await cursor.execute(cmd, params)
                     return cursor
-        except (ProgrammingError, DataError):
+        except MySQLError as exception:
             # В случае ошибки выполнения запроса, возвращаем None
-            pass
+            logging.warning(f"Ошибка выполнения SQL-запроса: {exception}.")
+
+    async def _input_batch(self, cmd: str, params: list) -> None:
+        """
+        Выполняет пакетный SQL-запрос (executemany) в одной транзакции.
+
+        aiomysql может разбить executemany на несколько INSERT, поэтому при ошибке
+        транзакция откатывается целиком и ни одна строка пачки не остается в таблице.
+
+        :param cmd: SQL-запрос для выполнения с плейсхолдерами %s.
+        :param params: Список кортежей параметров.
+        :raises MySQLError: Если запрос не удалось выполнить.
+        """
+        async with self.connection_pool.acquire() as connection:
+            await connection.begin()
+            try:
+                async with connection.cursor() as cursor:
+                    await cursor.executemany(cmd, params)
+                await connection.commit()
+            except BaseException:
+                await connection.rollback()
+                raise
 
 
 class Comments(SqlTable):
@@ -82,15 +123,25 @@ class Comments(SqlTable):
         """
         Загружает комментарии в таблицу базы данных.
 
+        Комментарии вставляются пачками по COMMENTS_CHUNK_SIZE строк,
+        чтобы не упираться в max_allowed_packet. Если пачку отклонила одна
+        некорректная строка (DataError), пачка повторяется построчно, и теряются
+        только отклоненные строки. Прочие ошибки MySQL пропускают только свою пачку,
+        остальные пачки все равно записываются.
+
         :param comments: Список комментариев для загрузки.
         """
-        for comment in comments:
-            # Формируем SQL-запрос для вставки комментария
-            cmd = """
-            INSERT INTO comments (text_comment)
-            VALUES ('{}');
-            """.format(comment.replace("'", "''"))
-            await self._input_cmd(cmd)
+        for start in range(0, len(comments), COMMENTS_CHUNK_SIZE):
+            rows = [(comment,) for comment in comments[start:start + COMMENTS_CHUNK_SIZE]]
+            try:
+                await self._input_batch(SQL_INSERT_COMMENT, rows)
+            except DataError as exception:
+                logging.warning(f"Пачка из {len(rows)} строк отклонена ({exception}), повтор построчно.")
+                for row in rows:
+                    if await self._input_cmd(SQL_INSERT_COMMENT, row) is None:
+                        logging.warning(f"Комментарий не записан в базу данных: {row[0][:100]!r}.")
+            except MySQLError as exception:
+                logging.warning(f"Пачка из {len(rows)} строк не записана в базу данных: {exception}.")
 
 
 class KeyPhrases(SqlTable):
@@ -105,6 +156,9 @@ async def initialize_database() -> Comments:
     """
     Инициализирует базу данных и возвращает объект для работы с таблицей комментариев.
 
+    Каждый вызов создает собственный пул соединений, закрывать его должен владелец
+    объекта через close_connect.
+
     :return: Объект класса Comments для работы с таблицей комментариев.
     """
     comments_table = Comments(
@@ -116,4 +170,4 @@ async def initialize_database() -> Comments:
 
     await comments_table.connect()
 
-    return comments_table
\ No newline at end of file
+    return comments_table
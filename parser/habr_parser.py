@@ -1,18 +1,27 @@
 import asyncio
 import aiohttp
-from asyncio.exceptions import TimeoutError, CancelledError
-from aiohttp_retry import RetryClient, ExponentialRetry
+from asyncio.exceptions import TimeoutError
+from aiohttp_retry import RetryClient, JitterRetry
+from aiolimiter import AsyncLimiter
 
+import codecs
+import os
 import random
+from io import BytesIO
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 
-from typing import List, Optional, Tuple, Any
+from typing import AsyncIterator, Awaitable, Callable, Iterable, List, Optional, Tuple, Any, TypeVar
 
 import logging
 
-from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
+from lxml import etree
+from lxml.html import HTMLParser, fromstring
 
-from database.database import initialize_database
+from database.database import Comments, initialize_database
 
 
 logging.basicConfig(
@@ -22,14 +31,163 @@ logging.basicConfig(
 )
 
 
+# Максимальный размер очередей ссылок между стадиями парсинга
+QUEUE_SIZE = 1024
+# Параметры повторных запросов: экспоненциальная задержка с ограничением и случайным разбросом
+RETRY_START_TIMEOUT = 1.0  # Задержка перед первым повтором (в секундах).
+RETRY_MAX_TIMEOUT = 30.0  # Максимальная задержка между повторами (в секундах).
+RETRY_FACTOR = 2.0
+# JitterRetry добавляет к задержке random.uniform(0, RETRY_JITTER) ** RETRY_FACTOR:
+# при 2.0 и factor=2.0 разброс от 0 до 4 секунд с медианой 1 секунда, что сопоставимо
+# с первыми задержками и разводит повторы одновременно упавших запросов.
+RETRY_JITTER = 2.0
+# Параметры очереди записи в базу данных
+WRITE_QUEUE_SIZE = 2048
+WRITE_BATCH_SIZE = 200  # Максимальное количество элементов очереди в одной пачке.
+WRITE_BATCH_TIMEOUT = 0.1  # Максимальное время сбора одной пачки (в секундах).
+# Ограничения пула HTTP-соединений
+CONNECTION_LIMIT = 200
+DNS_CACHE_TTL = 600  # Время жизни кэша DNS (в секундах).
+KEEPALIVE_TIMEOUT = 30  # Время удержания простаивающего соединения (в секундах).
+# Количество User-Agent, заранее сгенерированных при создании парсера
+UA_POOL_SIZE = 32
+
+T = TypeVar("T")
+Proxy = Tuple[Optional[str], Optional[aiohttp.BasicAuth]]  # Прокси и данные для аутентификации
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """
+    Ссылка на страницу вместе с ее идентификатором для логов.
+
+    Атрибуты:
+        url (str): URL страницы.
+        article_id (str): Номер страницы блога или статьи, вычисляется один раз при создании ссылки.
+    """
+    url: str
+    article_id: str
+
+
+# Общий парсер lxml для страниц, которые разбираются целиком.
+# Каждый процесс пула разбора получает собственный экземпляр при импорте модуля.
+# Без явной кодировки lxml определяет ее только по <meta charset> страницы, поэтому
+# кодировка из заголовка Content-Type передается в _get_html_parser и имеет приоритет.
+_HTML_PARSER = HTMLParser(remove_comments=True, remove_pis=True)
+
+# Заранее скомпилированные XPath-выражения для элементов страниц habr.com.
+# smart_strings=False возвращает обычные str без ссылок на узлы дерева.
+_XP_PAGINATION = etree.XPath("(//div[contains(@class,'tm-pagination__pages')])[1]")
+_XP_ARTICLE_LINKS = etree.XPath("//a[contains(@class,'tm-title__link')]/@href", smart_strings=False)
+_XP_COMMENTS = etree.XPath("//div[contains(@class,'tm-comment__body-content_v2')]//p")
+_XP_TEXT = etree.XPath("string()", smart_strings=False)  # Весь текст узла одной строкой
+_XP_TEXT_NODES = etree.XPath(".//text()", smart_strings=False)  # Все текстовые узлы внутри узла
+
+
+def _known_encoding(encoding: Optional[str]) -> Optional[str]:
+    """
+    Проверяет кодировку из заголовка Content-Type.
+
+    :param encoding: Кодировка ответа или None, если сервер ее не указал.
+    :return: Та же кодировка или None, если Python ее не знает.
+    """
+    if encoding is None:
+        return None
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        logging.warning(f"Неизвестная кодировка {encoding!r}, используется <meta charset> страницы")
+        return None
+    return encoding
+
+
+@lru_cache(maxsize=None)
+def _get_html_parser(encoding: Optional[str]) -> HTMLParser:
+    """
+    Возвращает парсер lxml для кодировки из заголовка Content-Type.
+
+    :param encoding: Кодировка ответа или None, если сервер ее не указал.
+    :return: Парсер с заданной кодировкой или общий парсер _HTML_PARSER без нее.
+    """
+    if encoding is None:
+        return _HTML_PARSER
+    return HTMLParser(remove_comments=True, remove_pis=True, encoding=encoding)
+
+
+# Функции разбора выполняются в пуле процессов, поэтому объявлены на уровне модуля
+# и возвращают только строки (деревья lxml нельзя передать между процессами).
+def _extract_last_page(html: bytes, encoding: Optional[str]) -> str:
+    """
+    Извлекает номер последней страницы блога.
+
+    :param html: Тело ответа в виде байтов.
+    :param encoding: Кодировка из заголовка Content-Type или None.
+    :return: Номер последней страницы в виде строки.
+    """
+    # Третий дочерний div блока пагинации содержит ссылку на последнюю страницу
+    pagination, = _XP_PAGINATION(fromstring(html, parser=_get_html_parser(encoding)))
+    return _XP_TEXT(pagination.findall("div")[2].find("a"))
+
+
+def _extract_articles_links(html: bytes, encoding: Optional[str]) -> List[Job]:
+    """
+    Извлекает ссылки на статьи со страницы блога.
+
+    :param html: Тело ответа в виде байтов.
+    :param encoding: Кодировка из заголовка Content-Type или None.
+    :return: Список задач с абсолютными URL статей.
+    """
+    return [
+        Job(f"https://habr.com{href}", href.rstrip("/").rpartition("/")[2])
+        for href in _XP_ARTICLE_LINKS(fromstring(html, parser=_get_html_parser(encoding)))
+    ]
+
+
+def _extract_article_text(html: bytes, encoding: Optional[str]) -> str:
+    """
+    Извлекает текст статьи.
+
+    Страница разбирается потоково и только до закрывающего тега тела статьи:
+    комментарии, боковая колонка и футер после него в дерево не попадают.
+
+    :param html: Тело ответа в виде байтов.
+    :param encoding: Кодировка из заголовка Content-Type или None.
+    :return: Текст статьи или пустая строка, если тело статьи не найдено.
+    """
+    events = etree.iterparse(
+        BytesIO(html), events=("end",), tag="div", html=True, remove_comments=True, remove_pis=True,
+        encoding=encoding
+    )
+    for _, element in events:
+        if "article-formatted-body" in element.get("class", ""):
+            return "\n".join(_XP_TEXT_NODES(element)).strip()
+    return ""
+
+
+def _extract_comments(html: bytes, encoding: Optional[str]) -> List[str]:
+    """
+    Извлекает тексты комментариев.
+
+    :param html: Тело ответа в виде байтов.
+    :param encoding: Кодировка из заголовка Content-Type или None.
+    :return: Список текстов комментариев.
+    """
+    tree = fromstring(html, parser=_get_html_parser(encoding))
+    return [_XP_TEXT(comment).strip() for comment in _XP_COMMENTS(tree)]
+
+
 class HabrParser:
+    HEADERS = {"User-Agent": ""}  # Шаблон заголовков запроса, User-Agent подставляется в _get_headers
+
     def __init__(
         self,
-        proxies: Optional[List[str]] = None,
+        proxies: Optional[List[Proxy]] = None,
         attemps: int = 10,
         statuses: Optional[List[int]] = None,
         exceptions: Optional[List[Exception]] = None,
-        timeout: int = 0
+        timeout: int = 0,
+        max_concurrency: int = 64,
+        rate_limit: float = 10
     ) -> None:
         """
         Инициализация парсера.
@@ -39,49 +197,291 @@ class HabrParser:
         :param statuses: Список HTTP-статусов, при которых повторять запрос.
         :param exceptions: Список исключений, при которых повторять запрос.
         :param timeout: Таймаут для HTTP-запросов.
+        :param max_concurrency: Максимальное количество одновременных HTTP-запросов.
+        :param rate_limit: Максимальное количество HTTP-запросов к сайту в секунду.
         """
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.proxies = proxies
-        self.retry_options = ExponentialRetry(
+        self.retry_options = JitterRetry(
             attempts=attemps,
+            start_timeout=RETRY_START_TIMEOUT,
+            max_timeout=RETRY_MAX_TIMEOUT,
+            factor=RETRY_FACTOR,
+            random_interval_size=RETRY_JITTER,
             statuses=statuses,
             exceptions=exceptions
         )
-        self.articles_links: List[str] = []  # Список для хранения ссылок на статьи
-        self.comments_links: List[str] = []  # Список для хранения ссылок на комментарии
-        self.ua = UserAgent()  # Генератор случайных User-Agent
+        ua = UserAgent()
+        self._ua_pool = [ua.random for _ in range(UA_POOL_SIZE)]  # Пул случайных User-Agent
+        self.max_concurrency = max_concurrency
+        self._sem = asyncio.Semaphore(max_concurrency)  # Ограничение числа одновременных запросов
+        self._rate = AsyncLimiter(rate_limit, 1)  # Ограничение частоты запросов к сайту
+        self._session: Optional[RetryClient] = None  # Общая HTTP-сессия на все время жизни парсера
+        self._active_calls = 0  # Количество активных публичных вызовов (и блоков async with)
+        self._parse_procs: Optional[ProcessPoolExecutor] = None  # Процессы для разбора HTML вне event loop
+        self._db: Optional[Comments] = None  # Таблица комментариев с собственным пулом соединений парсера
+        self._db_lock = asyncio.Lock()  # Не дает параллельным вызовам создать два пула соединений
+        # Очередь текстов на запись в БД и ее писатель, общие для всех вызовов внутри активной области
+        self._write_q: Optional[asyncio.Queue[Optional[List[str]]]] = None
+        self._writer: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self) -> "HabrParser":
+        """
+        Удерживает HTTP-сессию, пул процессов, пул соединений и писателя в базу данных
+        до выхода из блока async with.
+        """
+        await self._acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """
+        Освобождает ресурсы парсера, если это был последний активный вызов.
+        """
+        await self._release()
+
+    @asynccontextmanager
+    async def _call_scope(self) -> AsyncIterator[None]:
+        """
+        Оборачивает публичный метод парсинга: ресурсы закрываются, когда завершается
+        самый внешний вызов (вложенные вызовы и блок async with их не закрывают).
+        """
+        await self._acquire()
+        try:
+            yield
+        finally:
+            await self._release()
+
+    async def _acquire(self) -> None:
+        """
+        Увеличивает счетчик активных вызовов. Первый вызов создает очередь записи
+        и запускает единственного писателя в базу данных на всю активную область.
+
+        :raises MySQLError: Если не удалось подключиться к базе данных.
+        """
+        self._active_calls += 1
+        if self._active_calls == 1:
+            self._write_q = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+            self._writer = asyncio.create_task(self._db_writer(self._write_q))
+        try:
+            # Подключение проверяется сразу, чтобы вызов упал до начала парсинга
+            await self._get_db()
+        except BaseException:
+            await self._release()
+            raise
+
+    async def _release(self) -> None:
+        """
+        Уменьшает счетчик активных вызовов. При достижении нуля дожидается записи
+        оставшихся текстов и закрывает ресурсы.
+        """
+        self._active_calls -= 1
+        if self._active_calls == 0:
+            writer, write_q = self._writer, self._write_q
+            self._writer = None
+            try:
+                await self._stop_writer(writer, write_q)
+            finally:
+                await self.close()
 
     async def parsing_blog(self, main_url: str) -> None:
         """
         Основной метод для парсинга блога. Получает ссылки на все статьи и парсит их.
 
+        Стадии работают конвейером: ссылки со страниц блога сразу попадают в очередь статей,
+        обработанные статьи - в очередь комментариев, и каждую очередь разбирает фиксированный
+        пул воркеров. Запись в базу данных выполняет отдельный писатель, см. _db_writer.
+
         :param main_url: URL главной страницы блога.
         """
-        async with aiohttp.ClientSession(timeout=self.timeout, raise_for_status=False) as client_session:
-            async with RetryClient(client_session=client_session, retry_options=self.retry_options) as retry_session:
-                last_page = await self._get_last_page(retry_session, main_url)
+        async with self._call_scope():
+            session = await self._get_session()
+            last_page = await self._get_last_page(session, main_url)
 
+            # Очереди создаются на каждый вызов: параллельные вызовы не делят задачи,
+            # а задачи прерванного запуска не достаются следующему
+            page_q: asyncio.Queue[Job] = asyncio.Queue(maxsize=QUEUE_SIZE)
+            article_q: asyncio.Queue[Job] = asyncio.Queue(maxsize=QUEUE_SIZE)
+            comment_q: asyncio.Queue[Job] = asyncio.Queue(maxsize=QUEUE_SIZE)
+            workers = [
+                *self._start_workers(page_q, partial(self._get_articles_links, article_q=article_q), session),
+                *self._start_workers(article_q, partial(self._process_article, comment_q=comment_q), session),
+                *self._start_workers(comment_q, self._get_text_from_comments, session)
+            ]
+            try:
                 # Генерация ссылок на все страницы блога
-                page_links = [f"{main_url}page{i}/" for i in range(1, last_page + 1)]
-                await asyncio.gather(*[
-                        asyncio.create_task(self._get_articles_links(retry_session, page_url))
-                        for page_url in page_links
-                    ])
-                await self.parsing_articles(*self.articles_links, parsing_comments=True)
-    
+                for i in range(1, last_page + 1):
+                    await page_q.put(Job(f"{main_url}page{i}/", f"page{i}"))
+
+                # Стадии завершаются по порядку: каждая следующая очередь пополняется только предыдущей
+                await page_q.join()
+                await article_q.join()
+                await comment_q.join()
+            finally:
+                await self._stop_workers(workers)
+
+    async def _process_article(
+        self,
+        session: RetryClient,
+        article_job: Job,
+        proxy: Proxy,
+        *,
+        comment_q: "asyncio.Queue[Job]"
+    ) -> None:
+        """
+        Парсит статью и передает ссылку на ее комментарии в очередь комментариев.
+
+        :param session: Сессия для выполнения HTTP-запросов.
+        :param article_job: Статья для парсинга.
+        :param proxy: Прокси воркера и данные для аутентификации.
+        :param comment_q: Очередь ссылок на комментарии текущего вызова parsing_blog.
+        """
+        await self._get_text_from_article(session, article_job, proxy)
+        await comment_q.put(Job(f"{article_job.url}comments/", article_job.article_id))
+
+    def _start_workers(
+        self,
+        queue: "asyncio.Queue[Job]",
+        handler: Callable[[RetryClient, Job, Proxy], Awaitable[None]],
+        session: RetryClient
+    ) -> List["asyncio.Task[None]"]:
+        """
+        Запускает max_concurrency воркеров, обрабатывающих задачи из очереди.
+
+        :param queue: Очередь задач.
+        :param handler: Корутина, обрабатывающая одну задачу.
+        :param session: Сессия для выполнения HTTP-запросов.
+        :return: Список задач воркеров.
+        """
+        return [
+            asyncio.create_task(self._worker(queue, handler, session))
+            for _ in range(self.max_concurrency)
+        ]
+
+    async def _worker(
+        self,
+        queue: "asyncio.Queue[Job]",
+        handler: Callable[[RetryClient, Job, Proxy], Awaitable[None]],
+        session: RetryClient
+    ) -> None:
+        """
+        Бесконечно забирает задачи из очереди и обрабатывает их, пока воркер не отменят.
+
+        Прокси выбирается один раз на воркера, чтобы все его запросы шли через одно
+        keep-alive соединение.
+
+        :param queue: Очередь задач.
+        :param handler: Корутина, обрабатывающая одну задачу.
+        :param session: Сессия для выполнения HTTP-запросов.
+        """
+        proxy = self._get_proxy()
+        while True:
+            job = await queue.get()
+            try:
+                await handler(session, job, proxy)
+            except Exception:
+                # Одна упавшая страница не должна останавливать воркер, иначе queue.join() не дождется конца
+                logging.exception(f"Необработанная ошибка при парсинге страницы, url={job.url}.")
+            finally:
+                queue.task_done()
+
+    async def _stop_workers(self, workers: List["asyncio.Task[None]"]) -> None:
+        """
+        Отменяет воркеров и дожидается их завершения.
+
+        :param workers: Список задач воркеров.
+        """
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _run_workers(
+        self,
+        handler: Callable[[RetryClient, Job, Proxy], Awaitable[None]],
+        session: RetryClient,
+        jobs: Iterable[Job]
+    ) -> None:
+        """
+        Обрабатывает задачи фиксированным пулом воркеров через общую очередь.
+
+        :param handler: Корутина, обрабатывающая одну задачу.
+        :param session: Сессия для выполнения HTTP-запросов.
+        :param jobs: Задачи для обработки.
+        """
+        queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=QUEUE_SIZE)
+        workers = self._start_workers(queue, handler, session)
+        try:
+            for job in jobs:
+                await queue.put(job)
+            await queue.join()
+        finally:
+            await self._stop_workers(workers)
+
+    async def _db_writer(self, write_q: "asyncio.Queue[Optional[List[str]]]") -> None:
+        """
+        Забирает тексты из очереди записи и загружает их в базу данных пачками.
+
+        Писатель один на всю активную область парсера (см. _acquire) и обслуживает все
+        параллельные вызовы. Пачка отправляется, когда набралось WRITE_BATCH_SIZE элементов
+        очереди или прошло WRITE_BATCH_TIMEOUT секунд с начала ее сбора. Работа завершается
+        при получении None, который кладет только _release.
+        Ошибка записи пачки логируется и не останавливает писателя: иначе очередь
+        переполнится и все воркеры навсегда зависнут на put.
+
+        :param write_q: Очередь записи текущей активной области.
+        """
+        loop = asyncio.get_running_loop()
+        finished = False
+        while not finished and (texts := await write_q.get()) is not None:
+            batch = list(texts)
+            items = 1
+            deadline = loop.time() + WRITE_BATCH_TIMEOUT
+            while items < WRITE_BATCH_SIZE and (remaining := deadline - loop.time()) > 0:
+                try:
+                    texts = await asyncio.wait_for(write_q.get(), remaining)
+                except TimeoutError:
+                    break
+                if texts is None:
+                    finished = True
+                    break
+                batch.extend(texts)
+                items += 1
+            try:
+                db_comment = await self._get_db()
+                await db_comment.load_comments(*batch)
+            except Exception:
+                logging.exception(f"Ошибка записи в базу данных, потеряно текстов: {len(batch)}.")
+            else:
+                logging.info(f"В базу данных записано текстов: {len(batch)}.")
+
+    async def _stop_writer(
+        self,
+        writer: "asyncio.Task[None]",
+        write_q: "asyncio.Queue[Optional[List[str]]]"
+    ) -> None:
+        """
+        Сообщает писателю о конце данных и дожидается записи оставшихся пачек.
+
+        :param writer: Задача писателя, запущенная через _db_writer.
+        :param write_q: Очередь записи, которую обслуживает писатель.
+        """
+        if not writer.done():
+            await write_q.put(None)
+        await writer
+
     async def parsing_articles(self, *articles_urls: str, parsing_comments=False) -> None:
         """
         Парсинг текста статей и комментариев (опционально) по списку URL статей.
 
         :param articles_urls: Список URL статей для парсинга.
         """
-        db_comment = await initialize_database()
-        async with aiohttp.ClientSession(timeout=self.timeout, raise_for_status=False) as client_session:
-            async with RetryClient(client_session=client_session, retry_options=self.retry_options) as retry_session:
-                await asyncio.gather(*[self._get_text_from_article(retry_session, article_url, db_comment) for article_url in articles_urls])
-                if parsing_comments:
-                    comments_urls = [f"{article_url}comments/" for article_url in articles_urls]
-                    await self.parsing_comments(*comments_urls)
+        async with self._call_scope():
+            session = await self._get_session()
+            await self._run_workers(self._get_text_from_article, session, (
+                Job(article_url, article_url.split('/')[-2]) for article_url in articles_urls
+            ))
+            if parsing_comments:
+                comments_urls = [f"{article_url}comments/" for article_url in articles_urls]
+                await self.parsing_comments(*comments_urls)
     
     async def parsing_comments(self, *comments_urls: str) -> None:
         """
@@ -96,19 +496,111 @@ class HabrParser:
         Пример использования:
             await parsing_comments("http://example.com/comment1", "http://example.com/comment2")
         """
-        db_comment = await initialize_database()
-        async with aiohttp.ClientSession(timeout=self.timeout, raise_for_status=False) as client_session:
-            async with RetryClient(client_session=client_session, retry_options=self.retry_options) as retry_session:
-                await asyncio.gather(*[self._get_text_from_comments(retry_session, comment_url, db_comment) for comment_url in comments_urls])
+        async with self._call_scope():
+            session = await self._get_session()
+            await self._run_workers(self._get_text_from_comments, session, (
+                Job(comment_url, comment_url.split('/')[-3]) for comment_url in comments_urls
+            ))
 
-    async def _get_soup(self, response: aiohttp.ClientResponse) -> BeautifulSoup:
+    def _get_connector(self) -> aiohttp.TCPConnector:
         """
-        Преобразует ответ от сервера в объект BeautifulSoup для парсинга HTML.
+        Создает коннектор с keep-alive соединениями и кэшем DNS.
 
-        :param response: Ответ от сервера.
-        :return: Объект BeautifulSoup.
+        :return: Объект TCPConnector.
         """
-        return BeautifulSoup(await response.text(), "html.parser")
+        return aiohttp.TCPConnector(
+            limit=CONNECTION_LIMIT,
+            limit_per_host=self.max_concurrency,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+            keepalive_timeout=KEEPALIVE_TIMEOUT
+        )
+
+    async def _get_session(self) -> RetryClient:
+        """
+        Возвращает общую HTTP-сессию парсера, создавая ее при первом обращении.
+
+        :return: Сессия для выполнения HTTP-запросов с повторами.
+        """
+        if self._session is None:
+            # RetryClient повторяет запрос внутри session.get, поэтому лимит частоты
+            # применяется в хуке начала запроса - к каждой попытке, включая повторы
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            client_session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                raise_for_status=False,
+                connector=self._get_connector(),
+                headers={"Accept-Encoding": "gzip, deflate, br"},
+                auto_decompress=True,
+                trace_configs=[trace_config]
+            )
+            self._session = RetryClient(client_session=client_session, retry_options=self.retry_options)
+        return self._session
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        trace_config_ctx: Any,
+        params: aiohttp.TraceRequestStartParams
+    ) -> None:
+        """
+        Дожидается разрешения лимитера частоты перед каждой попыткой HTTP-запроса.
+
+        :param session: Сессия, выполняющая запрос.
+        :param trace_config_ctx: Контекст трассировки запроса.
+        :param params: Параметры запроса.
+        """
+        await self._rate.acquire()
+
+    async def _get_db(self) -> Comments:
+        """
+        Возвращает таблицу комментариев парсера, создавая пул соединений при первом обращении.
+
+        :return: Объект класса Comments для работы с таблицей комментариев.
+        """
+        async with self._db_lock:
+            if self._db is None:
+                self._db = await initialize_database()
+        return self._db
+
+    async def close(self) -> None:
+        """
+        Закрывает общую HTTP-сессию парсера, пул процессов разбора HTML и пул соединений с базой данных.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._parse_procs is not None:
+            # Не блокируем event loop ожиданием выхода дочерних процессов
+            self._parse_procs.shutdown(wait=False)
+            self._parse_procs = None
+        if self._db is not None:
+            await self._db.close_connect()
+            self._db = None
+
+    def _parse_in_pool(
+        self,
+        extract: Callable[[bytes, Optional[str]], T],
+        html: bytes,
+        encoding: Optional[str]
+    ) -> "asyncio.Future[T]":
+        """
+        Запускает разбор уже прочитанного тела ответа в пуле процессов.
+
+        Метод синхронный и возвращает future, которую ожидают на месте вызова,
+        поэтому на каждую страницу не создается лишняя корутина.
+
+        :param extract: Функция уровня модуля, извлекающая данные из HTML.
+        :param html: Тело ответа в виде байтов.
+        :param encoding: Кодировка из заголовка Content-Type (response.charset) или None.
+        :return: Future с результатом extract.
+        """
+        if self._parse_procs is None:
+            self._parse_procs = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return asyncio.get_running_loop().run_in_executor(
+            self._parse_procs, extract, html, _known_encoding(encoding)
+        )
 
     async def _get_last_page(self, session: RetryClient, url: str) -> int:
         """
@@ -118,82 +610,106 @@ class HabrParser:
         :param url: URL страницы для парсинга.
         :return: Номер последней страницы.
         """
-        proxy, proxy_auth = await self._get_proxy()
-        headers = {'User-Agent': self.ua.random}
+        proxy, proxy_auth = self._get_proxy()
+        headers = self._get_headers()
         try:
-            async with session.get(url, proxy=proxy, proxy_auth=proxy_auth, headers=headers) as response:
-                soup = await self._get_soup(response)
-                last_page_number = soup.select_one(
-                    "div.tm-pagination__pages > div:nth-child(3) > a:nth-child(1)"
-                ).text
-                logging.info(f"Номер последней страницы найден: {last_page_number}.")
-                return int(last_page_number)
-        except (TimeoutError, CancelledError) as exception:
+            async with self._sem:
+                async with session.get(url, proxy=proxy, proxy_auth=proxy_auth, headers=headers) as response:
+                    html = await response.read()
+                    charset = response.charset
+            last_page_number = await self._parse_in_pool(_extract_last_page, html, charset)
+            logging.info(f"Номер последней страницы найден: {last_page_number}.")
+            return int(last_page_number)
+        except TimeoutError as exception:
             logging.warning(f"Проблемы с получением последней страницы, ошибка={exception.__class__.__name__}.")
 
-    async def _get_articles_links(self, session: RetryClient, page_url: str) -> None:
+    async def _get_articles_links(
+        self,
+        session: RetryClient,
+        page_job: Job,
+        proxy: Proxy,
+        *,
+        article_q: "asyncio.Queue[Job]"
+    ) -> None:
         """
-        Получает ссылки на статьи с указанной страницы блога.
+        Получает ссылки на статьи с указанной страницы блога и кладет их в очередь статей.
 
         :param session: Сессия для выполнения HTTP-запросов.
-        :param page_url: URL страницы для парсинга.
+        :param page_job: Страница блога для парсинга.
+        :param proxy: Прокси воркера и данные для аутентификации.
+        :param article_q: Очередь ссылок на статьи текущего вызова parsing_blog.
         """
-        headers = {"User-Agent": self.ua.random}
-        proxy, proxy_auth = await self._get_proxy()
-        page_number = page_url.split('/')[-2]
+        headers = self._get_headers()
+        proxy, proxy_auth = proxy
         try:
-            async with session.get(page_url, proxy=proxy, proxy_auth=proxy_auth, headers=headers) as response:
-                soup = await self._get_soup(response)
-                articles_links_on_page = [
-                    f"https://habr.com{a_tag['href']}"
-                    for a_tag in soup.select("a.tm-title__link")
-                ]
-                logging.info(f"Страница: {page_number}. Ссылки на статьи успешно собраны.")
-                self.articles_links.extend(articles_links_on_page)
-        except (TimeoutError, CancelledError):
-            logging.warning(f"Ошибка подключения, страница: {page_number}.")
+            async with self._sem:
+                async with session.get(page_job.url, proxy=proxy, proxy_auth=proxy_auth, headers=headers) as response:
+                    html = await response.read()
+                    charset = response.charset
+            article_jobs = await self._parse_in_pool(_extract_articles_links, html, charset)
+            logging.info(f"Страница: {page_job.article_id}. Ссылки на статьи успешно собраны.")
+            for article_job in article_jobs:
+                await article_q.put(article_job)
+        except TimeoutError:
+            logging.warning(f"Ошибка подключения, страница: {page_job.article_id}.")
 
-    async def _get_text_from_article(self, session: RetryClient, article_page: str, db_comment: Any) -> None:
+    async def _get_text_from_article(self, session: RetryClient, article_job: Job, proxy: Proxy) -> None:
         """
-        Парсит текст статьи и сохраняет его в базу данных.
+        Парсит текст статьи и передает его в очередь записи в базу данных.
 
         :param session: Сессия для выполнения HTTP-запросов.
-        :param article_page: URL статьи для парсинга.
-        :param db_comment: Объект для работы с базой данных.
+        :param article_job: Статья для парсинга.
+        :param proxy: Прокси воркера и данные для аутентификации.
         """
-        headers = {"User-Agent": self.ua.random}
-        proxy, proxy_auth = await self._get_proxy()
-        article = article_page.split('/')[-2]
+        headers = self._get_headers()
+        proxy, proxy_auth = proxy
         try:
-            async with session.get(article_page, proxy=proxy, proxy_auth=proxy_auth, headers=headers) as response:
-                soup = await self._get_soup(response)
-                article_text = soup.select_one("div.article-formatted-body").get_text(separator="\n").strip()
-                await db_comment.load_comments(article_text)
-                logging.info(f"Article={article}. Статья успешно добавлен в базу данных.")
-        except (TimeoutError, CancelledError):
-            logging.warning(f"Ошибка в обработке текста статьи, article={article}.")
+            async with self._sem:
+                async with session.get(article_job.url, proxy=proxy, proxy_auth=proxy_auth, headers=headers) as response:
+                    html = await response.read()
+                    charset = response.charset
+            article_text = await self._parse_in_pool(_extract_article_text, html, charset)
+            if not article_text:
+                # Тело статьи не найдено (смена верстки, страница ошибки, пустой ответ)
+                logging.warning(f"Article={article_job.article_id}. Текст статьи не найден, url={article_job.url}.")
+                return
+            await self._write_q.put([article_text])
+            logging.info(f"Article={article_job.article_id}. Статья передана на запись в базу данных.")
+        except TimeoutError:
+            logging.warning(f"Ошибка в обработке текста статьи, article={article_job.article_id}.")
 
-    async def _get_text_from_comments(self, session: RetryClient, comment_url: str, db_comment: Any) -> None:
+    async def _get_text_from_comments(self, session: RetryClient, comment_job: Job, proxy: Proxy) -> None:
         """
-        Парсит текст комментариев и сохраняет его в базу данных.
+        Парсит текст комментариев и передает его в очередь записи в базу данных.
 
         :param session: Сессия для выполнения HTTP-запросов.
-        :param comment_url: URL страницы с комментариями.
-        :param db_comment: Объект для работы с базой данных.
+        :param comment_job: Страница с комментариями к статье.
+        :param proxy: Прокси воркера и данные для аутентификации.
         """
-        headers = {"User-Agent": self.ua.random}
-        proxy, proxy_auth = await self._get_proxy()
-        article = comment_url.split('/')[-3]
+        headers = self._get_headers()
+        proxy, proxy_auth = proxy
         try:
-            async with session.get(comment_url, proxy=proxy, proxy_auth=proxy_auth, headers=headers) as response:
-                soup = await self._get_soup(response)
-                comments = [comment.text.strip() for comment in soup.select("div.tm-comment__body-content_v2 p")]
-                await db_comment.load_comments(*comments)
-                logging.info(f"Article={article}. Комментарий добавлен в базу данных.")
-        except (TimeoutError, CancelledError):
-            logging.warning(f"Ошибка подключения или лимит таймаута комментариев, {article=}.")
-
-    async def _get_proxy(self) -> Tuple[Optional[str], Optional[str]]:
+            async with self._sem:
+                async with session.get(comment_job.url, proxy=proxy, proxy_auth=proxy_auth, headers=headers) as response:
+                    html = await response.read()
+                    charset = response.charset
+            comments = await self._parse_in_pool(_extract_comments, html, charset)
+            await self._write_q.put(comments)
+            logging.info(f"Article={comment_job.article_id}. Комментарии переданы на запись в базу данных.")
+        except TimeoutError:
+            logging.warning(f"Ошибка подключения или лимит таймаута комментариев, article={comment_job.article_id}.")
+
+    def _get_headers(self) -> dict:
+        """
+        Возвращает копию шаблона заголовков со случайным User-Agent из пула.
+
+        :return: Словарь заголовков запроса.
+        """
+        headers = self.HEADERS.copy()
+        headers["User-Agent"] = random.choice(self._ua_pool)
+        return headers
+
+    def _get_proxy(self) -> Proxy:
         """
         Возвращает случайный прокси из списка, если он задан.
 
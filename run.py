@@ -4,13 +4,16 @@ from parser.habr_parser import HabrParser
 from parser.settings import ParserSettings
 
 
-if __name__ == "__main__":
-    parser = HabrParser(
+async def main(url_blog: str) -> None:
+    async with HabrParser(
         proxies=ParserSettings.proxies,
         exceptions=ParserSettings.exceptions,
         timeout=ParserSettings.timeout,
         attemps=ParserSettings.attemps
-    )
+    ) as parser:
+        await parser.parsing_blog(url_blog)
+
 
+if __name__ == "__main__":
     url_blog = "https://habr.com/ru/companies/ru_mts/articles/"
-    asyncio.run(parser.parsing_blog(url_blog))
\ No newline at end of file
+    asyncio.run(main(url_blog))
\ No newline at end of file